@@ -1,11 +1,16 @@
 import sys
 import json
 import traceback
-import requests
+import atexit
 import os
+import re
+import time
 import html
 import urllib.parse
-from datetime import datetime
+from collections import OrderedDict
+from functools import lru_cache
+from operator import itemgetter
+from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
@@ -13,11 +18,113 @@ from PyQt6.QtWidgets import (
     QTabWidget, QInputDialog, QComboBox, QFileDialog, QSystemTrayIcon,
     QMenu, QStyle, QTabBar, QDialog, QDialogButtonBox
 )
-from PyQt6.QtCore import QThread, QObject, pyqtSignal, pyqtSlot, Qt, QTimer, QUrl
+from PyQt6.QtCore import QThread, QThreadPool, pyqtSignal, Qt, QTimer, QUrl
 from PyQt6.QtGui import QDesktopServices, QIcon, QAction
+from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
+
+# --- JSON 처리: 더 빠른 orjson이 설치되어 있으면 사용하고, 없으면 표준 json 모듈 사용 ---
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson:
+    _json_loads = orjson.loads
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+else:
+    _json_loads = json.loads
+    def _json_dumps(obj):
+        return json.dumps(obj, ensure_ascii=False, indent=4).encode('utf-8')
 
 # --- 설정 파일 경로 ---
 CONFIG_FILE = "news_scraper_config.json"
+READ_LINKS_LIMIT = 5000 # 읽음 목록에 보관할 최대 링크 수 (오래된 것부터 삭제)
+
+# --- 네이버 뉴스 검색 API ---
+NAVER_NEWS_API_URL = "https://openapi.naver.com/v1/search/news.json"
+API_TIMEOUT_MS = 10 * 1000
+
+# --- API 응답 캐시: {"키워드|display|sort": (저장 시각, items, 재검증 헤더)} ---
+_CACHE_TTL = 60 # 초
+_CACHE = {}
+
+# --- 검색어 강조용으로 네이버가 삽입하는 <b>, </b> 태그 ---
+_B_TAG = re.compile(r'</?b>')
+
+# --- HTML 이스케이프 변환표 (html.escape(quote=True)와 같은 결과를 str.translate 한 번으로 처리) ---
+_HTML_ESCAPE_TABLE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#x27;'})
+
+# --- 기사 딕셔너리의 파생 필드 ('_'로 시작하며 설정 파일에는 저장하지 않음) ---
+_MIN_DATE = datetime.min.replace(tzinfo=timezone.utc) # 날짜를 알 수 없는 기사의 정렬 기준
+
+@lru_cache(maxsize=4096)
+def _parse_pub_date(pub_date):
+    """
+    pubDate 문자열을 (정렬용 datetime, 표시용 문자열)로 변환합니다.
+    같은 시각에 발행된 기사가 많고 새로고침마다 같은 기사가 다시 오므로 결과를 캐시합니다.
+    """
+    try:
+        dt = parsedate_to_datetime(pub_date)
+    except (TypeError, ValueError):
+        return _MIN_DATE, "날짜 정보 없음"
+    if dt.tzinfo is None: # 시간대가 없는 날짜도 서로 비교할 수 있도록 UTC로 간주
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt, dt.strftime('%Y-%m-%d %H:%M')
+
+def _annotate_news(news):
+    """
+    발행일(pubDate)을 한 번만 파싱하여 정렬용 '_dt'와 표시용 '_dt_str'로 저장하고,
+    필터링용 소문자 제목/요약('_title_lc', '_desc_lc')도 미리 만들어 둡니다.
+    """
+    news['_title_lc'], news['_desc_lc'] = news['title'].lower(), news['description'].lower()
+    news['_dt'], news['_dt_str'] = _parse_pub_date(news.get('pubDate', ''))
+    return news
+
+def _public_news(news):
+    """파생 필드를 제외한, 저장/전달용 기사 딕셔너리를 반환합니다."""
+    return {key: value for key, value in news.items() if not key.startswith('_')}
+
+def _write_config(config):
+    """설정 딕셔너리를 파일에 기록합니다. 임시 파일에 먼저 쓴 뒤 교체하여, 저장 도중 종료되어도 기존 설정 파일이 깨지지 않도록 합니다."""
+    temp_file = CONFIG_FILE + ".tmp"
+    with open(temp_file, 'wb') as f:
+        f.write(_json_dumps(config))
+    os.replace(temp_file, CONFIG_FILE)
+
+# --- 애플리케이션 전역 스타일시트 (가독성 및 미관 개선, main에서 QApplication에 한 번만 적용) ---
+_APP_QSS = """
+    QMainWindow { background-color: #F0F2F5; }
+    QLabel { font-family: '맑은 고딕'; font-size: 10pt; }
+    QPushButton { font-family: '맑은 고딕'; font-size: 10pt; background-color: #FFFFFF; color: #333; padding: 8px 12px; border-radius: 6px; border: 1px solid #DCDCDC; }
+    QPushButton:hover { background-color: #E8E8E8; }
+    QPushButton#AddTab { font-weight: bold; background-color: #007AFF; color: white; border: none; }
+    QPushButton#AddTab:hover { background-color: #0056b3; }
+    QComboBox { font-family: '맑은 고딕'; font-size: 10pt; padding: 5px; border-radius: 6px; border: 1px solid #ccc; }
+    QTextBrowser { font-family: '맑은 고딕'; background-color: #FFFFFF; border: 1px solid #DCDCDC; border-radius: 8px; }
+    QTabWidget::pane { border-top: 1px solid #DCDCDC; }
+    QTabBar::tab { font-family: '맑은 고딕'; font-size: 10pt; color: #333; padding: 10px 15px; border: 1px solid transparent; border-bottom: none; background-color: transparent; }
+    QTabBar::tab:selected { background-color: #FFFFFF; border-color: #DCDCDC; border-top-left-radius: 6px; border-top-right-radius: 6px; color: #000; font-weight: bold; }
+    QTabBar::tab:!selected { color: #777; }
+    QTabBar::tab:!selected:hover { color: #333; }
+    QTabBar::close-button { padding: 2px; }
+    QLineEdit { font-family: '맑은 고딕'; font-size: 10pt; padding: 5px 8px; border-radius: 6px; border: 1px solid #ccc; }
+"""
+
+# --- 기사 하나의 HTML 템플릿 (스타일은 NewsScraperApp._BROWSER_CSS의 클래스로 지정) ---
+_NEWS_ITEM_TMPL = """
+        <div class="{item_class}">
+            <div class="title-row">
+                <span class="title">{title_prefix}{title_html}</span>
+            </div>
+            <div class="date">{formatted_date}{new_badge}</div>
+            <a href="{link_html}" class="link">{link_html}</a>
+            <span class="actions">{actions}</span>
+            <p class="desc">{desc_html}</p>
+        </div>"""
+
+# --- 결과 저장 파일의 기사 한 건 형식 ({0}: 번호, {1}: 기사 딕셔너리) ---
+_EXPORT_ITEM_TMPL = "[{0}] {1[title]}\n  - 링크: {1[link]}\n  - 요약: {1[description]}\n\n"
 
 # --- API 키 입력 다이얼로그 ---
 class ApiKeyDialog(QDialog):
@@ -59,54 +166,68 @@ class ApiKeyDialog(QDialog):
     def get_keys(self):
         return self.id_input.text().strip(), self.secret_input.text().strip()
 
-# --- 백그라운드 API 요청을 위한 Worker 클래스 ---
-class Worker(QObject):
-    """UI 멈춤 현상 없이 네트워크 요청을 처리하기 위한 스레드 작업자 클래스입니다."""
-    finished = pyqtSignal(list)
+# --- 결과 저장 작업자 ---
+class ExportWorker(QThread):
+    """UI 멈춤 없이 검색 결과를 텍스트 파일로 저장하기 위한 스레드 클래스입니다."""
+    saved = pyqtSignal(str) # 저장한 파일 경로
     error = pyqtSignal(str)
 
-    def __init__(self, keyword, exclude_keywords, client_id, client_secret):
-        super().__init__()
-        self.keyword = keyword
-        self.exclude_keywords = exclude_keywords
-        self.session = requests.Session()
-        self.session.headers.update({
-            "X-Naver-Client-Id": client_id,
-            "X-Naver-Client-Secret": client_secret,
-        })
-
-    @pyqtSlot()
+    def __init__(self, filepath, news_items, parent=None):
+        super().__init__(parent)
+        self.filepath = filepath
+        self.news_items = news_items
+
     def run(self):
         try:
-            news_items = self.fetch_naver_news(self.keyword)
-            self.finished.emit(news_items)
+            # 전체 내용을 한 번에 UTF-8 바이트로 인코딩한 뒤, 텍스트 모드 계층 없이 1MiB 단위로 직접 기록
+            format_item = _EXPORT_ITEM_TMPL.format
+            text = "".join([format_item(i, news) for i, news in enumerate(self.news_items, 1)])
+            if os.linesep != "\n": text = text.replace("\n", os.linesep) # 텍스트 모드와 같은 줄바꿈 유지
+            payload = memoryview(text.encode('utf-8'))
+            fd = os.open(self.filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+            try:
+                offset = 0
+                while offset < len(payload):
+                    offset += os.write(fd, payload[offset:offset + 1024 * 1024])
+            finally:
+                os.close(fd)
+            self.saved.emit(self.filepath)
         except Exception as e:
-            detailed_error = traceback.format_exc()
-            error_message = f"오류가 발생했습니다: {e}\n\n--- 상세 정보 ---\n{detailed_error}"
-            self.error.emit(error_message)
+            self.error.emit(str(e))
 
-    def fetch_naver_news(self, keyword):
-        api_url = "https://openapi.naver.com/v1/search/news.json"
-        params = {"query": keyword, "display": 100, "sort": "date"}
-        response = self.session.get(api_url, params=params)
-
-        if response.status_code != 200:
-            raise Exception(f"API 호출 실패: {response.status_code} - {response.text}")
-
-        response_json = response.json()
-        processed_news = []
-        for item in response_json.get("items", []):
-            title = html.unescape(item.get('title', '')).replace('<b>', '').replace('</b>', '')
-            description = html.unescape(item.get('description', '')).replace('<b>', '').replace('</b>', '')
-            if self.exclude_keywords and any(ex in title or ex in description for ex in self.exclude_keywords):
-                continue
-            processed_news.append({
-                'title': title,
-                'link': item.get('originallink', item.get('link', '')),
-                'description': description,
-                'pubDate': item.get('pubDate', '')
-            })
-        return processed_news
+# --- API 응답 가공 ---
+def _build_exclude_matcher(exclude_keywords):
+    """
+    제외어 검사 함수를 한 번만 만들어 모든 기사에 재사용합니다.
+    제외어가 많으면 하나의 정규식으로 컴파일해 제목과 요약을 이어 붙인 문자열을 한 번에 검사하고,
+    2개 이하일 때는 컴파일 비용이 더 크므로 단순 반복으로 검사합니다.
+    """
+    if not exclude_keywords:
+        return None
+    if len(exclude_keywords) <= 2:
+        return lambda title, description: any(ex in title or ex in description for ex in exclude_keywords)
+    pattern = re.compile("|".join(map(re.escape, exclude_keywords)))
+    return lambda title, description: pattern.search(f"{title}\x01{description}") is not None
+
+def _process_news_items(items, exclude_keywords):
+    """API 원본 items를 앱에서 사용하는 기사 딕셔너리 목록으로 변환하고 제외어가 포함된 기사는 거릅니다."""
+    is_excluded = _build_exclude_matcher(exclude_keywords)
+    unescape, strip_b_tags = html.unescape, _B_TAG.sub
+    processed_news = []
+    for item in items:
+        get = item.get
+        # 네이버가 붙이는 <b> 태그를 먼저 한 번에 제거한 뒤 엔티티를 복원
+        title = unescape(strip_b_tags('', get('title', '')))
+        description = unescape(strip_b_tags('', get('description', '')))
+        if is_excluded and is_excluded(title, description):
+            continue
+        processed_news.append(_annotate_news({
+            'title': title,
+            'link': get('originallink') or get('link', ''),
+            'description': description,
+            'pubDate': get('pubDate', '')
+        }))
+    return processed_news
 
 # --- 메인 애플리케이션 윈도우 클래스 ---
 class NewsScraperApp(QMainWindow):
@@ -130,17 +251,39 @@ class NewsScraperApp(QMainWindow):
         # --- 1. 중앙 데이터 모델 (Single Source of Truth) ---
         self.client_id = ""
         self.client_secret = ""
-        self.read_links = set()
-        self.bookmarked_news = []
-        self.tab_data = {} # 각 탭의 뉴스 데이터: {'탭 이름': [news_items]}
-
-        # --- 백그라운드 작업을 위한 멤버 변수 ---
-        self.thread = None
-        self.worker = None
+        self.read_links = OrderedDict() # 읽은 링크: {링크: None} (최근에 읽은 순서, 최대 READ_LINKS_LIMIT개)
+        self.bookmarked_news = {} # 북마크: {링크: news_item} (추가된 순서, 가장 최근 북마크가 마지막)
+        self.tab_data = {} # 각 탭의 뉴스 데이터: {tab_id: [news_items]} (탭 이름이 바뀌어도 키는 그대로)
+        self._next_tab_id = 1 # 0은 북마크 탭
+        self._view_version = 0 # 읽음/북마크 상태가 화면에 영향을 주도록 바뀔 때마다 증가 (렌더링 결과 재사용 판단용)
+
+        # --- 네트워크 요청은 Qt 이벤트 루프에서 비동기로 처리 (별도 스레드 없음) ---
+        self._nam = QNetworkAccessManager(self)
+        self._export_worker = None # 진행 중인 결과 저장 스레드
+
+        # --- 잦은 상태 변경을 한 번의 저장으로 묶기 위한 타이머 ---
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._do_save_config)
+        # 종료 시 백그라운드에서 진행 중인 설정 저장(flush_config)이 끝날 때까지 프로세스 종료를 미룸 (한 번만 등록)
+        atexit.register(QThreadPool.globalInstance().waitForDone)
 
         self.setWindowTitle("실시간 뉴스 검색 (네이버 API) v8.0")
         self.setGeometry(100, 100, 900, 750)
-        self.setWindowIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogDetailedView))
+        # 표준 아이콘은 한 번만 만들어 두고 재사용
+        style = self.style()
+        self._icons = {name: style.standardIcon(pixmap) for name, pixmap in {
+            "app": QStyle.StandardPixmap.SP_FileDialogDetailedView,
+            "tray": QStyle.StandardPixmap.SP_ComputerIcon,
+            "refresh": QStyle.StandardPixmap.SP_BrowserReload,
+            "save": QStyle.StandardPixmap.SP_DialogSaveButton,
+            "api_settings": QStyle.StandardPixmap.SP_ToolBarHorizontalExtensionButton,
+            "folder": QStyle.StandardPixmap.SP_DirIcon,
+            "add_tab": QStyle.StandardPixmap.SP_FileIcon,
+            "bookmark": QStyle.StandardPixmap.SP_DirHomeIcon,
+        }.items()}
+        self.setWindowIcon(self._icons["app"])
 
         self.init_ui()
         self.init_tray_icon()
@@ -159,7 +302,7 @@ class NewsScraperApp(QMainWindow):
 
     def init_tray_icon(self):
         self.tray_icon = QSystemTrayIcon(self)
-        self.tray_icon.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_ComputerIcon))
+        self.tray_icon.setIcon(self._icons["tray"])
         self.tray_icon.setToolTip("실시간 뉴스 검색")
         tray_menu = QMenu()
         show_action, quit_action = QAction("열기", self), QAction("종료", self)
@@ -173,24 +316,6 @@ class NewsScraperApp(QMainWindow):
         self.tray_icon.showMessage('새 뉴스 알림', f"'{keyword}'에 {count}개의 새로운 뉴스가 도착했습니다.", QSystemTrayIcon.MessageIcon.Information, 3000)
 
     def init_ui(self):
-        # 스타일시트 설정 (가독성 및 미관 개선)
-        self.setStyleSheet("""
-            QMainWindow { background-color: #F0F2F5; }
-            QLabel { font-family: '맑은 고딕'; font-size: 10pt; }
-            QPushButton { font-family: '맑은 고딕'; font-size: 10pt; background-color: #FFFFFF; color: #333; padding: 8px 12px; border-radius: 6px; border: 1px solid #DCDCDC; }
-            QPushButton:hover { background-color: #E8E8E8; }
-            QPushButton#AddTab { font-weight: bold; background-color: #007AFF; color: white; border: none; }
-            QPushButton#AddTab:hover { background-color: #0056b3; }
-            QComboBox { font-family: '맑은 고딕'; font-size: 10pt; padding: 5px; border-radius: 6px; border: 1px solid #ccc; }
-            QTextBrowser { font-family: '맑은 고딕'; background-color: #FFFFFF; border: 1px solid #DCDCDC; border-radius: 8px; }
-            QTabWidget::pane { border-top: 1px solid #DCDCDC; }
-            QTabBar::tab { font-family: '맑은 고딕'; font-size: 10pt; color: #333; padding: 10px 15px; border: 1px solid transparent; border-bottom: none; background-color: transparent; }
-            QTabBar::tab:selected { background-color: #FFFFFF; border-color: #DCDCDC; border-top-left-radius: 6px; border-top-right-radius: 6px; color: #000; font-weight: bold; }
-            QTabBar::tab:!selected { color: #777; }
-            QTabBar::tab:!selected:hover { color: #333; }
-            QTabBar::close-button { padding: 2px; }
-            QLineEdit { font-family: '맑은 고딕'; font-size: 10pt; padding: 5px 8px; border-radius: 6px; border: 1px solid #ccc; }
-        """)
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
         main_layout = QVBoxLayout(central_widget)
@@ -199,11 +324,11 @@ class NewsScraperApp(QMainWindow):
 
         # 상단 제어판 레이아웃
         control_layout = QHBoxLayout()
-        self.refresh_button = QPushButton(self.style().standardIcon(QStyle.StandardPixmap.SP_BrowserReload), " 새로고침")
-        self.export_button = QPushButton(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogSaveButton), " 결과 저장")
-        self.api_settings_button = QPushButton(self.style().standardIcon(QStyle.StandardPixmap.SP_ToolBarHorizontalExtensionButton), " API 설정")
-        self.open_config_folder_button = QPushButton(self.style().standardIcon(QStyle.StandardPixmap.SP_DirIcon), " 설정 폴더")
-        self.add_tab_button = QPushButton(self.style().standardIcon(QStyle.StandardPixmap.SP_FileIcon), "+ 새 탭 추가")
+        self.refresh_button = QPushButton(self._icons["refresh"], " 새로고침")
+        self.export_button = QPushButton(self._icons["save"], " 결과 저장")
+        self.api_settings_button = QPushButton(self._icons["api_settings"], " API 설정")
+        self.open_config_folder_button = QPushButton(self._icons["folder"], " 설정 폴더")
+        self.add_tab_button = QPushButton(self._icons["add_tab"], "+ 새 탭 추가")
         self.add_tab_button.setObjectName("AddTab")
         self.refresh_interval_combo = QComboBox()
         self.refresh_interval_combo.addItems(["10분", "30분", "1시간", "3시간", "6시간", "자동 새로고침 안함"])
@@ -261,13 +386,16 @@ class NewsScraperApp(QMainWindow):
     def on_tab_changed(self, index):
         self.refresh_button.setDisabled(index == 0) # 북마크 탭에서는 새로고침 비활성화
         tab_content = self.tab_widget.widget(index)
-        if tab_content and hasattr(tab_content, 'new_links') and tab_content.new_links:
+        if not tab_content: return
+        if tab_content.new_links:
             tab_content.new_links.clear()
             # 탭에 (N) 표시가 있으면 원래 제목으로 되돌림
             if self.tab_widget.tabText(index) != tab_content.original_title:
                 self.tab_widget.setTabText(index, tab_content.original_title)
             # 데이터를 다시 렌더링하여 'New' 배지 등을 업데이트
             self.render_tab_content(tab_content)
+        elif tab_content.needs_redraw: # 보이지 않는 동안 데이터가 바뀐 탭은 선택될 때 다시 그림
+            self.render_tab_content(tab_content)
 
     def setup_auto_refresh(self):
         self.auto_refresh_timer = QTimer(self)
@@ -279,8 +407,11 @@ class NewsScraperApp(QMainWindow):
         if self.tab_widget.count() <= 1: return
         
         self.statusBar().showMessage("모든 탭 자동 새로고침 중...")
+        # API 호출이 한꺼번에 몰리지 않도록 탭마다 200ms씩 간격을 두고 요청
+        # (그 사이 탭이 이동/닫힐 수 있으므로 인덱스 대신 탭 ID로 실행 시점에 탭을 찾음)
         for i in range(1, self.tab_widget.count()):
-            self.start_fetching(is_auto=True, target_index=i)
+            tab_id = self.tab_widget.widget(i).tab_id
+            QTimer.singleShot(200 * (i - 1), lambda tid=tab_id: self.start_fetching(is_auto=True, target_index=self.find_tab_index_by_id(tid)))
 
     def update_refresh_interval(self):
         if not hasattr(self, 'auto_refresh_timer'): return
@@ -308,49 +439,71 @@ class NewsScraperApp(QMainWindow):
     def load_config(self):
         if not os.path.exists(CONFIG_FILE): return
         try:
-            with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            with open(CONFIG_FILE, 'rb') as f:
+                config = _json_loads(f.read())
             app_settings = config.get("app_settings", {})
             self.client_id = app_settings.get("client_id", "")
             self.client_secret = app_settings.get("client_secret", "")
             refresh_index = app_settings.get("refresh_interval_index", 2)
             if 0 <= refresh_index < self.refresh_interval_combo.count():
                 self.refresh_interval_combo.setCurrentIndex(refresh_index)
-            self.read_links = set(config.get("read_links", []))
-            self.bookmarked_news = config.get("bookmarks", [])
+            self.read_links = OrderedDict.fromkeys(config.get("read_links", [])[-READ_LINKS_LIMIT:])
+            # 설정 파일에는 최근 북마크가 앞에 저장되어 있으므로 뒤집어서 추가 순서로 복원
+            self.bookmarked_news = {news['link']: _annotate_news(news) for news in reversed(config.get("bookmarks", []))}
             for keyword in config.get("tabs", []):
                 self.create_tab(keyword)
         except (json.JSONDecodeError, KeyError) as e:
             QMessageBox.critical(self, "설정 파일 오류", f"설정 파일을 불러오는 중 오류가 발생했습니다: {e}\n기본 설정으로 시작합니다.")
 
     def save_config(self):
+        """설정 저장을 예약합니다. 짧은 시간 안에 여러 번 호출되어도 500ms 뒤 한 번만 저장합니다."""
+        self._save_timer.start()
+
+    def flush_config(self):
+        """
+        예약된 저장을 기다리지 않고 바로 저장합니다. (종료 시 사용)
+        현재 상태의 사본을 만든 뒤 파일 기록은 백그라운드 스레드에서 처리하여 창이 바로 닫히도록 하고,
+        프로세스는 종료 직전(atexit)에 기록이 끝날 때까지 기다립니다.
+        """
+        self._save_timer.stop()
+        config = self._config_snapshot()
+
+        def write():
+            try:
+                _write_config(config)
+            except Exception:
+                traceback.print_exc() # 창이 이미 닫혔으므로 상태 표시줄 대신 표준 오류로 출력
+
+        QThreadPool.globalInstance().start(write)
+
+    def _config_snapshot(self):
+        """현재 상태를 저장용 딕셔너리로 만듭니다. 반환값은 이후 상태 변경과 공유하는 객체가 없습니다."""
+        tabs_to_save = [
+            widget.original_title
+            for i in range(1, self.tab_widget.count())
+            if (widget := self.tab_widget.widget(i)) and hasattr(widget, 'original_title')
+        ]
+        return {
+            "app_settings": {
+                "refresh_interval_index": self.refresh_interval_combo.currentIndex(),
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+            },
+            "tabs": tabs_to_save,
+            "read_links": list(self.read_links.keys()),
+            "bookmarks": [_public_news(news) for news in reversed(self.bookmarked_news.values())]
+        }
+
+    def _do_save_config(self):
         try:
-            tabs_to_save = [
-                widget.original_title
-                for i in range(1, self.tab_widget.count())
-                if (widget := self.tab_widget.widget(i)) and hasattr(widget, 'original_title')
-            ]
-
-            config = {
-                "app_settings": {
-                    "refresh_interval_index": self.refresh_interval_combo.currentIndex(),
-                    "client_id": self.client_id,
-                    "client_secret": self.client_secret,
-                },
-                "tabs": tabs_to_save,
-                "read_links": list(self.read_links),
-                "bookmarks": self.bookmarked_news
-            }
-            with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-                json.dump(config, f, ensure_ascii=False, indent=4)
+            _write_config(self._config_snapshot())
         except Exception as e:
             self.statusBar().showMessage(f"설정 파일 저장 오류: {e}")
 
     def create_bookmark_tab(self):
         tab_content = self.create_tab_content_widget()
         tab_content.original_title = "북마크"
-        icon = self.style().standardIcon(QStyle.StandardPixmap.SP_DirHomeIcon)
-        index = self.tab_widget.insertTab(0, tab_content, icon, "북마크")
+        index = self.tab_widget.insertTab(0, tab_content, self._icons["bookmark"], "북마크")
         self.tab_widget.tabBar().setTabButton(index, QTabBar.ButtonPosition.RightSide, None)
 
     def create_tab_content_widget(self):
@@ -374,7 +527,11 @@ class NewsScraperApp(QMainWindow):
         
         # 뉴스 내용이 표시될 브라우저
         browser = QTextBrowser(openExternalLinks=False)
+        browser.document().setDefaultStyleSheet(self._BROWSER_CSS)
         browser.anchorClicked.connect(self.handle_link_click)
+        browser.verticalScrollBar().valueChanged.connect(lambda _value: self.render_more_items(tab_content_widget))
+        # 창 크기 변경 등으로 문서가 화면보다 짧아져 스크롤할 수 없게 되어도 다음 묶음을 이어서 그림
+        browser.verticalScrollBar().rangeChanged.connect(lambda _min, _max: self.render_more_items(tab_content_widget))
         
         layout.addLayout(top_bar_layout)
         layout.addWidget(browser)
@@ -386,31 +543,56 @@ class NewsScraperApp(QMainWindow):
         tab_content_widget.sort_combo = sort_combo
         tab_content_widget.new_links = set()
         tab_content_widget.original_title = ""
+        tab_content_widget.primary_keyword = "" # 강조 표시에 쓰는 대표 검색어 (탭 키워드가 정해질 때 한 번만 파싱)
+        tab_content_widget.tab_id = 0 # tab_data의 키 (create_tab에서 부여, 북마크 탭은 0)
+        tab_content_widget.pending_items = [] # 정렬/필터링된 표시 대상 기사 (앞에서부터 rendered_count개만 HTML로 만들어 표시)
+        tab_content_widget.render_ctx = None # pending_items를 HTML로 만들 때 쓰는 렌더링 공통 값 (_news_item_fields의 ctx)
+        tab_content_widget.rendered_count = 0
+        tab_content_widget.render_key = None # 마지막으로 그린 화면의 상태 키 (같으면 다시 그리지 않음)
+        tab_content_widget.needs_redraw = False # 보이지 않는 동안 데이터가 바뀌어 다시 그려야 하는지 여부
+
+        # 빠르게 입력할 때 키 입력마다 다시 그리지 않도록, 마지막 입력 후 120ms 뒤에 한 번만 렌더링
+        filter_timer = QTimer(tab_content_widget)
+        filter_timer.setSingleShot(True)
+        filter_timer.setInterval(120)
+        filter_timer.timeout.connect(lambda: self.render_tab_content(tab_content_widget))
+        tab_content_widget.filter_timer = filter_timer
 
         # 필터링, 정렬, 모두 읽음 버튼의 동작 연결
-        filter_input.textChanged.connect(lambda: self.render_tab_content(tab_content_widget))
+        filter_input.textChanged.connect(lambda _text: filter_timer.start())
         sort_combo.currentIndexChanged.connect(lambda: self.render_tab_content(tab_content_widget))
         mark_all_read_button.clicked.connect(lambda: self.mark_all_as_read(tab_content_widget))
         return tab_content_widget
     
     def mark_all_as_read(self, tab_content):
         keyword = tab_content.original_title
-        source_data = self.tab_data.get(keyword, []) if keyword != "북마크" else self.bookmarked_news
+        source_data = self.tab_data.get(tab_content.tab_id, []) if keyword != "북마크" else self.bookmarked_news.values()
         
         count = 0
         for item in source_data:
             if item['link'] not in self.read_links:
-                self.read_links.add(item['link'])
+                self.mark_as_read(item['link'])
                 count += 1
         
         if count > 0:
-            self.render_tab_content(tab_content) # UI 갱신
+            self.save_config()
+            self.redraw_all_tabs() # 같은 기사를 보여 주는 다른 탭(북마크 등)도 읽음 상태를 반영하도록 갱신
             self.statusBar().showMessage(f"{count}개 기사를 읽음으로 처리했습니다.")
 
+    def mark_as_read(self, link):
+        """링크를 읽음 목록의 가장 최근 위치에 추가하고, 한도를 넘으면 가장 오래된 링크를 버립니다."""
+        if link not in self.read_links: self._view_version += 1
+        self.read_links[link] = None
+        self.read_links.move_to_end(link)
+        if len(self.read_links) > READ_LINKS_LIMIT:
+            self.read_links.popitem(last=False)
+
     def create_tab(self, keyword):
-        self.tab_data[keyword] = [] # 데이터 모델에 새 키워드 공간 생성
         tab_content = self.create_tab_content_widget()
         tab_content.original_title = keyword
+        tab_content.primary_keyword = self._parse_keywords(keyword)[0]
+        tab_content.tab_id, self._next_tab_id = self._next_tab_id, self._next_tab_id + 1
+        self.tab_data[tab_content.tab_id] = [] # 데이터 모델에 새 탭 공간 생성
         index = self.tab_widget.addTab(tab_content, keyword)
         self.tab_widget.setCurrentIndex(index)
         return tab_content
@@ -422,31 +604,37 @@ class NewsScraperApp(QMainWindow):
         # 앱 내부 동작을 위한 커스텀 스킴 'app://' 처리
         if scheme == 'app':
             action = url.host()
-            # URL Path의 첫 '/'를 제거한 후 data로 사용
-            data = url.path().lstrip('/') 
+            # URL Path의 첫 '/'를 제거하고 인코딩된 기사 링크를 원래대로 디코딩하여 data로 사용
+            data = urllib.parse.unquote(url.path(QUrl.ComponentFormattingOption.FullyEncoded).lstrip('/'))
 
             if action == 'unread':
-                if data in self.read_links: self.read_links.remove(data)
-                self.redraw_current_tab()
+                if data in self.read_links:
+                    del self.read_links[data]
+                    self._view_version += 1
+                    self.save_config()
+                self.redraw_all_tabs()
             elif action == 'toggle_bookmark':
-                try:
-                    # 1. URL로 전달된 인코딩된 문자열을 원래대로 디코딩
-                    decoded_news_str = urllib.parse.unquote(data)
-                    # 2. 디코딩된 JSON 문자열을 파이썬 딕셔너리 객체로 변환
-                    news_item = json.loads(decoded_news_str)
-                    # 3. 데이터 모델을 변경하는 함수 호출
+                # 링크로 중앙 데이터 모델에서 기사를 찾아 데이터 모델을 변경하는 함수 호출
+                if news_item := self.find_news_item(data):
                     self.toggle_bookmark(news_item)
-                except (json.JSONDecodeError, TypeError) as e:
-                    # [개선] 오류 발생 시 사용자에게 명확한 피드백 제공
-                    error_details = f"북마크 데이터를 처리하는 중 오류가 발생했습니다.\n\n오류: {e}\n\n데이터: {data[:100]}..."
-                    QMessageBox.critical(self, "북마크 오류", error_details)
+                else:
+                    QMessageBox.critical(self, "북마크 오류", f"북마크할 기사를 찾을 수 없습니다.\n\n링크: {data[:100]}")
         
         # 일반 웹 링크 처리
         else:
             url_string = url.toString()
-            self.read_links.add(url_string) # 읽음 목록에 추가
+            self.mark_as_read(url_string) # 읽음 목록에 추가
+            self.save_config()
             QDesktopServices.openUrl(url)
-            self.redraw_current_tab() # '읽음' 상태를 반영하기 위해 현재 탭 다시 그리기
+            self.redraw_all_tabs() # '읽음' 상태를 반영하기 위해 탭 다시 그리기
+
+    def find_news_item(self, link):
+        """링크로 북마크 목록 또는 현재 탭의 뉴스 데이터에서 기사를 찾습니다."""
+        if news_item := self.bookmarked_news.get(link):
+            return news_item
+        current_tab = self.tab_widget.currentWidget()
+        source_data = self.tab_data.get(current_tab.tab_id, []) if current_tab else []
+        return next((item for item in source_data if item['link'] == link), None)
 
     def toggle_bookmark(self, news_item_to_toggle):
         """
@@ -455,26 +643,28 @@ class NewsScraperApp(QMainWindow):
         link_to_toggle = news_item_to_toggle.get('link')
         if not link_to_toggle: return
 
-        is_bookmarked = any(item['link'] == link_to_toggle for item in self.bookmarked_news)
-        
         # 1. 중앙 데이터 모델 (self.bookmarked_news) 변경
-        if is_bookmarked:
-            self.bookmarked_news = [item for item in self.bookmarked_news if item['link'] != link_to_toggle]
-        else:
-            self.bookmarked_news.insert(0, news_item_to_toggle)
+        if link_to_toggle in self.bookmarked_news:
+            del self.bookmarked_news[link_to_toggle]
+        else: # 딕셔너리를 새로 만들지 않고 제자리에서 추가 (렌더링 중인 탭이 같은 객체를 계속 참조함)
+            self.bookmarked_news[link_to_toggle] = _annotate_news(news_item_to_toggle)
+        self._view_version += 1
+        
+        self.save_config()
         
         # 2. 데이터 변경 후, 이 데이터에 의존하는 모든 UI를 다시 그리도록 요청
         self.redraw_all_tabs()
 
     def redraw_all_tabs(self):
-        """북마크 상태 변경 후 모든 탭을 다시 그려 데이터-UI 일관성을 유지합니다."""
+        """
+        북마크/읽음 상태 변경 후 모든 탭의 데이터-UI 일관성을 유지합니다.
+        보이는 탭만 즉시 다시 그리고, 나머지 탭은 표시만 해 두었다가 선택될 때(on_tab_changed) 다시 그립니다.
+        """
+        current_tab = self.tab_widget.currentWidget()
         for i in range(self.tab_widget.count()):
-            if tab_content := self.tab_widget.widget(i):
-                self.render_tab_content(tab_content)
-
-    def redraw_current_tab(self):
-        if current_tab := self.tab_widget.currentWidget():
-            self.render_tab_content(current_tab)
+            if (tab_content := self.tab_widget.widget(i)) and tab_content is not current_tab:
+                tab_content.needs_redraw = True
+        self.render_tab_content(current_tab)
 
     def redraw_bookmark_tab(self):
         if bookmark_tab := self.tab_widget.widget(0):
@@ -486,30 +676,25 @@ class NewsScraperApp(QMainWindow):
         이 함수가 UI 렌더링의 핵심입니다.
         """
         if not tab_content: return
+        tab_content.needs_redraw = False
 
         keyword = tab_content.original_title
         is_bookmark_tab = (keyword == "북마크")
 
         # 1. 데이터 소스 결정 (북마크 탭인가, 일반 검색 탭인가?)
-        source_data = self.bookmarked_news if is_bookmark_tab else self.tab_data.get(keyword, [])
+        source_data = self.bookmarked_news.values() if is_bookmark_tab else self.tab_data.get(tab_content.tab_id, [])
 
         # 2. 필터링 및 정렬
         filter_text = tab_content.filter_input.text().lower()
         sort_order = tab_content.sort_combo.currentText()
         
-        filtered_items = [
-            item for item in source_data
-            if not filter_text or filter_text in item['title'].lower() or filter_text in item['description'].lower()
-        ]
-        
-        # 날짜 문자열을 datetime 객체로 변환하여 정렬 (안정성 강화)
-        def get_date(item):
-            try:
-                return parsedate_to_datetime(item['pubDate'])
-            except:
-                return datetime.min
-
-        display_items = sorted(filtered_items, key=get_date, reverse=(sort_order == '최신순'))
+        # 중간 목록 없이 필터링과 정렬을 한 번에 처리 (소문자 제목/요약과 발행일은 수집 시점에 미리 계산됨)
+        if filter_text:
+            source_data = (
+                item for item in source_data
+                if filter_text in item['_title_lc'] or filter_text in item['_desc_lc']
+            )
+        display_items = sorted(source_data, key=itemgetter('_dt'), reverse=(sort_order == '최신순'))
 
         # 3. HTML 렌더링
         self.render_html(tab_content, display_items)
@@ -522,12 +707,9 @@ class NewsScraperApp(QMainWindow):
 
         text, ok = QInputDialog.getText(self, '탭 이름 변경', '새 키워드를 입력하세요:', text=old_name)
         if ok and text and text != old_name:
-            # 데이터 모델의 키를 변경
-            if old_name in self.tab_data:
-                self.tab_data[text] = self.tab_data.pop(old_name)
-            
-            # UI 위젯 정보 업데이트
+            # 데이터 모델은 탭 ID로 관리되므로 UI 위젯 정보만 업데이트
             tab_content.original_title = text
+            tab_content.primary_keyword = self._parse_keywords(text)[0]
             self.tab_widget.setTabText(index, text)
             self.start_fetching(target_index=index)
 
@@ -535,19 +717,30 @@ class NewsScraperApp(QMainWindow):
         text, ok = QInputDialog.getText(self, '새 탭 추가', '검색 키워드를 입력하세요 (예: 네이버)')
         if ok and text:
             # 이미 있는 탭인지 확인
-            for i in range(1, self.tab_widget.count()):
-                if self.tab_widget.widget(i).original_title == text:
-                    self.tab_widget.setCurrentIndex(i)
-                    return
+            if (index := self.find_tab_index(text)) > 0:
+                self.tab_widget.setCurrentIndex(index)
+                return
             self.create_tab(text)
             self.start_fetching()
 
+    def find_tab_index(self, title):
+        """키워드(original_title)로 뉴스 탭의 현재 인덱스를 찾습니다. 없으면 -1을 반환합니다."""
+        for i in range(1, self.tab_widget.count()):
+            if self.tab_widget.widget(i).original_title == title:
+                return i
+        return -1
+
+    def find_tab_index_by_id(self, tab_id):
+        """탭 ID로 뉴스 탭의 현재 인덱스를 찾습니다. 탭이 이동했어도 찾을 수 있고, 닫혔다면 -1을 반환합니다."""
+        for i in range(1, self.tab_widget.count()):
+            if self.tab_widget.widget(i).tab_id == tab_id:
+                return i
+        return -1
+
     def close_tab(self, index):
         if index == 0: return # 북마크 탭은 닫기 불가
         if widget := self.tab_widget.widget(index):
-            keyword_to_delete = widget.original_title
-            if keyword_to_delete in self.tab_data:
-                del self.tab_data[keyword_to_delete]
+            self.tab_data.pop(widget.tab_id, None)
             widget.deleteLater()
         self.tab_widget.removeTab(index)
 
@@ -572,30 +765,77 @@ class NewsScraperApp(QMainWindow):
             self.refresh_button.setEnabled(False)
             status_message = f"'{keyword}' 뉴스를 검색 중입니다..."
             self.statusBar().showMessage(status_message)
+            tab_content.pending_items, tab_content.rendered_count, tab_content.render_key = [], 0, None
             tab_content.browser.setHtml(f"<div style='padding: 20px; text-align: center; color: #888;'>{status_message}</div>")
         
-        self.thread = QThread()
-        self.worker = Worker(keyword, exclude_keywords, self.client_id, self.client_secret)
-        self.worker.moveToThread(self.thread)
-        self.thread.started.connect(self.worker.run)
-        self.worker.finished.connect(lambda items, tc=tab_content, ia=is_auto: self.update_results(items, tc, ia))
-        self.worker.error.connect(self.handle_error)
-        self.worker.finished.connect(self.thread.quit)
-        self.worker.finished.connect(self.worker.deleteLater)
-        self.thread.finished.connect(self.thread.deleteLater)
-        self.thread.start()
-
-    def update_results(self, news_items, target_tab_content, is_auto):
-        tab_key = target_tab_content.original_title
-        target_index = self.tab_widget.indexOf(target_tab_content)
+        # 탭 위젯 대신 탭 ID를 넘겨, 요청 중에 탭이 닫혀도 안전하게 결과를 버릴 수 있도록 함
+        tab_id = tab_content.tab_id
+        params = {"query": keyword, "display": 100, "sort": "date"}
+        cache_key = f"{keyword}|{params['display']}|{params['sort']}"
+
+        # 같은 쿼리는 _CACHE_TTL 동안 메모리 캐시에서 바로 응답
+        hit = _CACHE.get(cache_key)
+        if hit and time.monotonic() - hit[0] < _CACHE_TTL:
+            self.update_results(_process_news_items(hit[1], exclude_keywords), tab_id, is_auto, keyword_text)
+            return
+
+        request = QNetworkRequest(QUrl(f"{NAVER_NEWS_API_URL}?{urllib.parse.urlencode(params)}"))
+        request.setRawHeader(b"X-Naver-Client-Id", self.client_id.encode())
+        request.setRawHeader(b"X-Naver-Client-Secret", self.client_secret.encode())
+        request.setTransferTimeout(API_TIMEOUT_MS)
+        if hit: # 만료된 캐시는 ETag/Last-Modified로 재검증
+            for name, value in hit[2].items():
+                request.setRawHeader(name.encode(), value.encode())
+
+        reply = self._nam.get(request)
+        reply.finished.connect(
+            lambda r=reply, tid=tab_id, ex=exclude_keywords, ia=is_auto, kw=keyword_text, ck=cache_key, h=hit:
+                self._on_reply(r, tid, ex, ia, kw, ck, h)
+        )
 
-        if target_index < 0: # 탭이 그 사이에 닫혔을 경우
+    def _on_reply(self, reply, tab_id, exclude_keywords, is_auto, requested_title, cache_key, hit):
+        """
+        API 응답을 처리합니다. 원본 items는 제외어 필터링 전 상태로 캐시하므로 제외어만 다른 탭끼리도 캐시를 공유하고,
+        304(변경 없음) 응답이면 캐시된 items를 그대로 사용합니다.
+        """
+        reply.deleteLater()
+        status = reply.attribute(QNetworkRequest.Attribute.HttpStatusCodeAttribute)
+        try:
+            if status == 304 and hit:
+                items = hit[1]
+                _CACHE[cache_key] = (time.monotonic(), items, hit[2])
+            elif status == 200:
+                items = _json_loads(bytes(reply.readAll())).get("items", [])
+                validators = {}
+                if reply.hasRawHeader(b"ETag"):
+                    validators["If-None-Match"] = bytes(reply.rawHeader(b"ETag")).decode()
+                if reply.hasRawHeader(b"Last-Modified"):
+                    validators["If-Modified-Since"] = bytes(reply.rawHeader(b"Last-Modified")).decode()
+                _CACHE[cache_key] = (time.monotonic(), items, validators)
+            elif status is None:
+                raise Exception(f"네트워크 오류: {reply.errorString()}")
+            else:
+                raise Exception(f"API 호출 실패: {status} - {bytes(reply.readAll()).decode('utf-8', 'replace')}")
+            news_items = _process_news_items(items, exclude_keywords)
+        except Exception as e:
+            detailed_error = traceback.format_exc()
+            self.handle_error(f"오류가 발생했습니다: {e}\n\n--- 상세 정보 ---\n{detailed_error}", tab_id)
+            return
+        self.update_results(news_items, tab_id, is_auto, requested_title)
+
+    def update_results(self, news_items, tab_id, is_auto, requested_title):
+        target_index = self.find_tab_index_by_id(tab_id)
+        target_tab_content = self.tab_widget.widget(target_index) if target_index > 0 else None
+
+        # 탭이 그 사이에 닫혔거나, 이름이 바뀌어 이전 키워드의 결과가 늦게 도착한 경우
+        if not target_tab_content or target_tab_content.original_title != requested_title:
             if not is_auto: self.refresh_button.setEnabled(True)
             return
+        tab_key = target_tab_content.original_title
 
         if is_auto:
             main_keyword, _ = self._parse_keywords(tab_key)
-            previous_links = {item['link'] for item in self.tab_data.get(tab_key, [])}
+            previous_links = {item['link'] for item in self.tab_data.get(tab_id, [])}
             new_links_set = {item['link'] for item in news_items}
             truly_new_links = new_links_set - previous_links
             
@@ -606,83 +846,161 @@ class NewsScraperApp(QMainWindow):
                     new_count = len(target_tab_content.new_links)
                     self.tab_widget.setTabText(target_index, f"{tab_key} ({new_count})")
         
-        self.tab_data[tab_key] = news_items
+        self.tab_data[tab_id] = news_items
         
-        # 현재 보이는 탭인 경우에만 즉시 렌더링
+        # 현재 보이는 탭인 경우에만 즉시 렌더링 (그 외에는 선택될 때 렌더링)
         if self.tab_widget.currentIndex() == target_index:
             self.render_tab_content(target_tab_content)
             target_tab_content.last_updated_label.setText(f"업데이트: {datetime.now().strftime('%H:%M:%S')}")
+        else:
+            target_tab_content.needs_redraw = True
         
         if not is_auto or self.tab_widget.currentIndex() == target_index:
             self.refresh_button.setEnabled(True)
     
-    def _create_news_item_html(self, news, keyword, is_bookmark_tab, new_links, bookmarked_links):
-        is_read = news['link'] in self.read_links
-        is_bookmarked = news['link'] in bookmarked_links
-        is_new = news['link'] in new_links
+    _RENDER_BATCH = 30 # 한 번에 그리는 기사 수
+
+    # 뉴스 목록 공통 스타일: 기사마다 인라인 style을 반복하지 않고 각 브라우저 문서의 기본 스타일시트로 한 번만 지정
+    _BROWSER_CSS = """
+        .item { border: 1px solid #E9ECEF; border-radius: 8px; padding: 15px; margin-bottom: 10px; background-color: #FFFFFF; }
+        .item-read { opacity: 0.7; border: 1px solid #E9ECEF; border-radius: 8px; padding: 15px; margin-bottom: 10px; background-color: #F8F9FA; }
+        .title-row { margin-bottom: 5px; }
+        .title { font-size: 12pt; font-weight: bold; color: #212529; }
+        .date { font-size: 9pt; color: #6C757D; margin-bottom: 8px; }
+        .link { font-size: 9pt; color: #007BFF; text-decoration: none; word-break: break-all; }
+        .actions { float: right; }
+        .desc { font-size: 10pt; color: #495057; margin-top: 10px; line-height: 1.6; }
+        .hl { background-color: #FFF3CD; }
+        .new { font-size: 8pt; color: white; background-color: #DC3545; padding: 2px 5px; border-radius: 4px; margin-left: 8px; }
+        .act-unread { font-size: 9pt; color: #6C757D; text-decoration: none; margin-left: 10px; }
+        .act-bm-add { font-size: 9pt; color: #007BFF; text-decoration: none; margin-left: 10px; }
+        .act-bm-del { font-size: 9pt; color: #DC3545; text-decoration: none; margin-left: 10px; }
+    """
 
-        background_color = "#F8F9FA" if is_read else "#FFFFFF"
-        opacity = "0.7" if is_read else "1.0"
-        
-        title_prefix = "⭐ " if is_bookmarked else ""
-        title_html = html.escape(news['title'])
-        desc_html = html.escape(news['description'])
-        if keyword:
-            highlight = f"<span style='background-color: #FFF3CD;'>{keyword}</span>"
-            title_html = title_html.replace(keyword, highlight)
-            desc_html = desc_html.replace(keyword, highlight)
-
-        new_badge = "<span style='font-size: 8pt; color: white; background-color: #DC3545; padding: 2px 5px; border-radius: 4px; margin-left: 8px;'>New</span>" if is_new else ""
-        
-        try:
-            formatted_date = parsedate_to_datetime(news['pubDate']).strftime('%Y-%m-%d %H:%M')
-        except: formatted_date = "날짜 정보 없음"
-
-        # [핵심] 북마크 링크 생성:
-        # 1. 뉴스 아이템(딕셔너리)을 JSON 문자열로 변환합니다.
-        news_json = json.dumps(news, ensure_ascii=False)
-        # 2. URL에 포함될 수 있도록 특수문자를 인코딩합니다. (e.g., " " -> %20)
-        encoded_news = urllib.parse.quote(news_json)
-        # 3. 'app://' 스킴을 사용하여 앱 내부 동작임을 명시하는 링크를 만듭니다.
-        bookmark_url = f"app://toggle_bookmark/{encoded_news}"
-
-        actions = ""
-        if is_read:
-            actions += f"<a href='app://unread/{news['link']}' style='font-size: 9pt; color: #6C757D; text-decoration: none; margin-left: 10px;'>[안 읽음으로]</a>"
-        
-        bookmark_text = "[북마크 삭제]" if is_bookmark_tab or is_bookmarked else "[북마크]"
-        bookmark_color = "#DC3545" if is_bookmark_tab or is_bookmarked else "#007BFF"
-        actions += f"<a href='{bookmark_url}' style='font-size: 9pt; color: {bookmark_color}; text-decoration: none; margin-left: 10px;'>{bookmark_text}</a>"
-
-        return f"""
-        <div style="opacity: {opacity}; border: 1px solid #E9ECEF; border-radius: 8px; padding: 15px; margin-bottom: 10px; background-color: {background_color};">
-            <div style="margin-bottom: 5px;">
-                <span style="font-size: 12pt; font-weight: bold; color: #212529;">{title_prefix}{title_html}</span>
-            </div>
-            <div style="font-size: 9pt; color: #6C757D; margin-bottom: 8px;">{formatted_date}{new_badge}</div>
-            <a href="{news['link']}" style="font-size: 9pt; color: #007BFF; text-decoration: none; word-break: break-all;">{news['link']}</a>
-            <span style="float: right;">{actions}</span>
-            <p style="font-size: 10pt; color: #495057; margin-top: 10px; line-height: 1.6;">{desc_html}</p>
-        </div>"""
+    # 검색어 강조 태그 (렌더링마다 다시 만들지 않도록 클래스 상수로 보관)
+    _HIGHLIGHT_OPEN = "<span class='hl'>"
+    _HIGHLIGHT_CLOSE = "</span>"
+
+    # 기사마다 같은 모양으로 반복되는 배지/동작 링크 (동작 링크는 인코딩된 기사 링크만 채워 넣음)
+    _NEW_BADGE_HTML = "<span class='new'>New</span>"
+    _UNREAD_BTN_HTML = "<a href='app://unread/{link}' class='act-unread'>[안 읽음으로]</a>"
+    _BOOKMARK_ADD_BTN_HTML = "<a href='app://toggle_bookmark/{link}' class='act-bm-add'>[북마크]</a>"
+    _BOOKMARK_DEL_BTN_HTML = "<a href='app://toggle_bookmark/{link}' class='act-bm-del'>[북마크 삭제]</a>"
+
+    # 표시할 기사가 없을 때의 안내 화면
+    _EMPTY_BOOKMARK_HTML = "<div style='padding: 20px; text-align: center; color: #888;'>북마크된 기사가 없습니다.</div>"
+    _EMPTY_NEWS_HTML = "<div style='padding: 20px; text-align: center; color: #888;'>표시할 뉴스 기사가 없습니다.</div>"
+
+    def _text_html(self, text, keyword_re=None):
+        """
+        원문 텍스트를 HTML로 이스케이프하고, keyword_re가 있으면 일치하는 부분을 강조 태그로 감쌉니다.
+        검색어는 이스케이프 전 원문에서 찾으므로 '&amp;' 같은 엔티티 안쪽이 강조되어 깨지는 일이 없습니다.
+        """
+        if keyword_re is None:
+            return text.translate(_HTML_ESCAPE_TABLE)
+        parts, last = [], 0
+        for match in keyword_re.finditer(text):
+            start, end = match.span()
+            parts += (text[last:start].translate(_HTML_ESCAPE_TABLE), self._HIGHLIGHT_OPEN,
+                      text[start:end].translate(_HTML_ESCAPE_TABLE), self._HIGHLIGHT_CLOSE)
+            last = end
+        parts.append(text[last:].translate(_HTML_ESCAPE_TABLE))
+        return "".join(parts)
+
+    def _news_item_fields(self, news, ctx):
+        """
+        기사 하나를 _NEWS_ITEM_TMPL에 채울 값 딕셔너리로 만듭니다.
+        ctx는 render_html에서 렌더링마다 한 번만 계산한 (검색어 정규식, 북마크 탭 여부, 읽음/새 기사/북마크 링크 집합) 묶음입니다.
+        """
+        keyword_re, is_bookmark_tab, read_links, new_links, bookmarked_links = ctx
+        link = news['link']
+        is_read = link in read_links
+        is_bookmarked = link in bookmarked_links
+
+        # [핵심] 앱 내부 동작 링크 생성:
+        # 기사 전체 대신 링크만 인코딩하여 'app://' 스킴에 담고, 클릭 시 링크로 데이터 모델에서 기사를 찾습니다.
+        encoded_link = urllib.parse.quote(link, safe='')
+        actions = self._UNREAD_BTN_HTML.format(link=encoded_link) if is_read else ""
+        bookmark_btn = self._BOOKMARK_DEL_BTN_HTML if is_bookmark_tab or is_bookmarked else self._BOOKMARK_ADD_BTN_HTML
+        actions += bookmark_btn.format(link=encoded_link)
+
+        return {
+            'item_class': "item-read" if is_read else "item",
+            'title_prefix': "⭐ " if is_bookmarked else "",
+            'title_html': self._text_html(news['title'], keyword_re),
+            'formatted_date': news['_dt_str'],
+            'new_badge': self._NEW_BADGE_HTML if link in new_links else "",
+            'link_html': self._text_html(link),
+            'actions': actions,
+            'desc_html': self._text_html(news['description'], keyword_re),
+        }
 
     def render_html(self, tab_content, news_items):
         browser = tab_content.browser
+        set_html, scroll_bar = browser.setHtml, browser.verticalScrollBar()
         keyword = tab_content.original_title
         is_bookmark_tab = (keyword == "북마크")
         
-        search_keyword = "" if is_bookmark_tab else self._parse_keywords(keyword)[0]
+        search_keyword = tab_content.primary_keyword # 북마크 탭은 빈 문자열
         new_links = getattr(tab_content, 'new_links', set())
-        bookmarked_links = {item['link'] for item in self.bookmarked_news}
+        bookmarked_links = self.bookmarked_news # 링크를 키로 하는 딕셔너리이므로 그대로 멤버십 검사에 사용 (별도 집합 생성 불필요)
+
+        # 표시할 기사 순서와 내용, 읽음/북마크/새 기사 상태, 강조 검색어가 지난번과 같으면 다시 그리지 않음 (스크롤 위치도 유지됨)
+        # 링크 순서([3])와 화면에 보이는 내용([4])을 따로 두어, 내용만 바뀐 경우에도 다시 그리되 스크롤 위치는 유지되도록 함
+        render_key = (
+            self._view_version, search_keyword, frozenset(new_links),
+            tuple(news['link'] for news in news_items),
+            tuple((news['title'], news['description'], news['_dt_str']) for news in news_items),
+        )
+        if render_key == tab_content.render_key: return
+        previous_key, tab_content.render_key = tab_content.render_key, render_key
 
         if not news_items:
-            msg = "북마크된 기사가 없습니다." if is_bookmark_tab else "표시할 뉴스 기사가 없습니다."
-            browser.setHtml(f"<div style='padding: 20px; text-align: center; color: #888;'>{msg}</div>")
+            tab_content.pending_items, tab_content.rendered_count = [], 0
+            set_html(self._EMPTY_BOOKMARK_HTML if is_bookmark_tab else self._EMPTY_NEWS_HTML)
             return
             
-        html_content = "<body style='margin: 5px;'>" + "".join(
-            [self._create_news_item_html(news, search_keyword, is_bookmark_tab, new_links, bookmarked_links) for news in news_items]
-        ) + "</body>"
-        browser.setHtml(html_content)
+        # 검색어는 렌더링당 한 번만 정규식으로 컴파일 (대소문자 구분 없이 원문에서 찾고, 원문 표기 그대로 강조)
+        keyword_re = re.compile(re.escape(search_keyword), re.IGNORECASE) if search_keyword else None
+        tab_content.render_ctx = (keyword_re, is_bookmark_tab, self.read_links, new_links, bookmarked_links)
+
+        # 기사 목록은 그대로이고 읽음/북마크 같은 상태만 바뀌었다면, 보고 있던 만큼 다시 그리고 스크롤 위치를 되돌림
+        same_items = previous_key is not None and previous_key[3] == render_key[3]
+        count, position = (max(tab_content.rendered_count, self._RENDER_BATCH), scroll_bar.value()) if same_items else (self._RENDER_BATCH, 0)
+
+        # 문서 레이아웃 비용과 메모리를 줄이기 위해 첫 묶음의 HTML만 만들어 그리고,
+        # 나머지 기사는 스크롤할 때 render_more_items에서 그 묶음만큼만 HTML로 만들어 이어 붙임
+        tab_content.pending_items = news_items
+        tab_content.rendered_count = min(count, len(news_items))
+        scroll_bar.blockSignals(True) # 문서 교체 중 스크롤 위치 초기화로 추가 렌더링이 일어나지 않도록 함
+        set_html(f"<body style='margin: 5px;'>{self._news_items_html(tab_content, 0, tab_content.rendered_count)}</body>")
+        scroll_bar.setValue(position)
+        scroll_bar.blockSignals(False)
+        QTimer.singleShot(0, lambda: self.render_more_items(tab_content)) # 첫 묶음이 화면을 다 채우지 못하면 바로 이어 그림
+
+    def _news_items_html(self, tab_content, start, end):
+        """pending_items[start:end] 구간의 기사들을 하나의 HTML 문자열로 만듭니다."""
+        ctx, item_fields, format_item = tab_content.render_ctx, self._news_item_fields, _NEWS_ITEM_TMPL.format_map
+        return "".join([format_item(item_fields(news, ctx)) for news in tab_content.pending_items[start:end]])
+
+    def render_more_items(self, tab_content):
+        """
+        스크롤이 문서 끝에서 한 화면 이내로 가까워지거나 문서가 화면보다 짧으면,
+        아직 그리지 않은 기사를 다음 묶음만큼 이어 붙입니다.
+        """
+        total, start = len(tab_content.pending_items), tab_content.rendered_count
+        if start >= total: return
+
+        scroll_bar = tab_content.browser.verticalScrollBar()
+        position = scroll_bar.value()
+        if position < scroll_bar.maximum() - scroll_bar.pageStep(): return # 미리 그려 둘 만큼 끝에 가깝지 않음
+
+        end = min(start + self._RENDER_BATCH, total)
+        tab_content.rendered_count = end
+        scroll_bar.blockSignals(True)
+        tab_content.browser.append(self._news_items_html(tab_content, start, end))
+        scroll_bar.setValue(position) # append가 스크롤을 문서 끝으로 옮기지 않도록 원래 위치 유지
+        scroll_bar.blockSignals(False)
 
     def export_results(self):
         current_index = self.tab_widget.currentIndex()
@@ -690,7 +1008,7 @@ class NewsScraperApp(QMainWindow):
         
         tab_content = self.tab_widget.widget(current_index)
         keyword = tab_content.original_title
-        source_data = self.bookmarked_news if keyword == "북마크" else self.tab_data.get(keyword, [])
+        source_data = list(reversed(self.bookmarked_news.values())) if keyword == "북마크" else self.tab_data.get(tab_content.tab_id, [])
         
         if not source_data:
             QMessageBox.information(self, "알림", "저장할 뉴스 데이터가 없습니다.")
@@ -700,28 +1018,45 @@ class NewsScraperApp(QMainWindow):
         
         filepath, _ = QFileDialog.getSaveFileName(self, "결과 저장", default_filename, "Text Files (*.txt)")
         if filepath:
-            try:
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    for i, news in enumerate(source_data, 1):
-                        f.write(f"[{i}] {news['title']}\n")
-                        f.write(f"  - 링크: {news['link']}\n")
-                        f.write(f"  - 요약: {news['description']}\n\n")
-                self.statusBar().showMessage(f"'{os.path.basename(filepath)}' 파일로 저장 완료")
-            except Exception as e:
-                QMessageBox.critical(self, "저장 오류", f"파일 저장 중 오류 발생: {e}")
-
-    def handle_error(self, error_message):
+            # 파일 기록은 별도 스레드에서 처리하고, 끝날 때까지 저장 버튼을 비활성화
+            self.export_button.setEnabled(False)
+            self.statusBar().showMessage(f"'{os.path.basename(filepath)}' 파일로 저장 중...")
+            worker = ExportWorker(filepath, list(source_data), self)
+            worker.saved.connect(lambda path: self.statusBar().showMessage(f"'{os.path.basename(path)}' 파일로 저장 완료"))
+            worker.error.connect(self.on_export_error)
+            worker.finished.connect(self.on_export_finished)
+            self._export_worker = worker
+            worker.start()
+
+    def on_export_error(self, message):
+        self.statusBar().showMessage("파일 저장 실패") # '저장 중...' 안내가 남지 않도록 교체
+        QMessageBox.critical(self, "저장 오류", f"파일 저장 중 오류 발생: {message}")
+
+    def on_export_finished(self):
+        self._export_worker.deleteLater()
+        self._export_worker = None
+        self.export_button.setEnabled(True)
+
+    def handle_error(self, error_message, tab_id=0):
         QMessageBox.critical(self, "오류 발생", f"뉴스 검색 중 오류가 발생했습니다.\n\nAPI 키가 정확한지, 하루 사용량을 초과하지 않았는지 확인해주세요.\n\n{error_message}")
-        self.statusBar().showMessage("오류 발생. 대기 중")
+        target_index = self.find_tab_index_by_id(tab_id)
+        tab_key = self.tab_widget.widget(target_index).original_title if target_index > 0 else ""
+        self.statusBar().showMessage(f"'{tab_key}' 검색 중 오류 발생. 대기 중" if tab_key else "오류 발생. 대기 중")
         self.refresh_button.setEnabled(True)
 
     def closeEvent(self, event):
-        self.save_config()
+        self.flush_config()
+        if self._export_worker: self._export_worker.wait() # 저장 중인 파일은 끝까지 기록
+        # 진행 중인 요청은 결과를 처리하지 않고 중단
+        for reply in self._nam.findChildren(QNetworkReply):
+            reply.finished.disconnect()
+            reply.abort()
         super().closeEvent(event)
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     app.setStyle("Fusion")
+    app.setStyleSheet(_APP_QSS)
     main_window = NewsScraperApp()
     main_window.show()
     sys.exit(app.exec())